@@ -11,20 +11,42 @@ This module is imported by the in-process CPython bridge and provides:
 
 from __future__ import annotations
 
+import array
+import functools
 import io
 import os
 import platform
 import struct
 import sys
+import threading
 import time
-import wave
-from typing import Any, Optional, Sequence
+from types import GeneratorType
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except Exception:
+    np = None
+
+_TORCH_IMPORT_ERROR: Optional[BaseException] = None
+try:
+    import torch as _torch  # type: ignore[import-not-found]
+except Exception as error:
+    _torch = None
+    _TORCH_IMPORT_ERROR = error
+
+# Snapshot array classes once so hot paths dispatch with a single isinstance check.
+_TENSOR_CLS: tuple[type, ...] = (_torch.Tensor,) if _torch is not None else ()
+_NDARRAY_CLS: tuple[type, ...] = (np.ndarray,) if np is not None else ()
+_BYTES_LIKE = (bytes, bytearray, memoryview)
 
 _MODEL_LOADED = False
 _QWEN_MODEL: Optional[Any] = None
 _QWEN_MODULE: Optional[Any] = None
 _ACTIVE_MODE: Optional[str] = None
 _ACTIVE_MODEL_ID: Optional[str] = None
+# (mode, model_id) of the loaded model; None whenever no model is loaded.
+_ACTIVE_KEY: Optional[tuple[str, str]] = None
 
 DEFAULT_MODE = os.getenv("TTM_QWEN_MODE", "voice_design")
 DEFAULT_VOICE_DESIGN_MODEL = "Qwen/Qwen3-TTS-12Hz-1.7B-VoiceDesign"
@@ -35,6 +57,11 @@ DEFAULT_SPEAKER = os.getenv("TTM_QWEN_SPEAKER", "ryan")
 _ALLOW_FALLBACK = os.getenv("TTM_QWEN_ALLOW_FALLBACK", "0") == "1"
 _DEBUG = os.getenv("TTM_QWEN_DEBUG", "0") == "1"
 _ALLOW_CROSS_MODE_FALLBACK = os.getenv("TTM_QWEN_ALLOW_CROSS_MODE_FALLBACK", "1") == "1"
+_EAGER_LOAD = os.getenv("TTM_QWEN_EAGER_LOAD", "0") == "1"
+# Set only while the CPU/float32 retry reloads the model. Otherwise device map and dtype are read live
+# on each load: the module outlives bridge instances, and hosts change these between them.
+_DEVICE_MAP_OVERRIDE: Optional[str] = None
+_TORCH_DTYPE_OVERRIDE: Optional[str] = None
 
 MODEL_REGISTRY: dict[str, list[str]] = {
     "voice_design": [
@@ -51,29 +78,40 @@ MODEL_REGISTRY: dict[str, list[str]] = {
 }
 
 
+def _wav_header(frame_count: int, sample_rate: int) -> bytes:
+    # Canonical 44-byte RIFF header for mono 16-bit PCM.
+    data_size = frame_count * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+@functools.lru_cache(maxsize=8)
 def _silent_wav(sample_rate: int, seconds: float = 0.35) -> bytes:
     frame_count = max(1, int(sample_rate * seconds))
-    pcm = b"\x00\x00" * frame_count
-    with io.BytesIO() as buffer:
-        with wave.open(buffer, "wb") as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)
-            wav.setframerate(sample_rate)
-            wav.writeframes(pcm)
-        return buffer.getvalue()
-
-
-def _flatten_numeric_samples(data: Any) -> list[float]:
-    if hasattr(data, "detach") and callable(data.detach):
-        try:
-            data = data.detach().cpu().numpy()
-        except Exception:
-            pass
-    if hasattr(data, "tolist") and callable(data.tolist):
-        try:
-            data = data.tolist()
-        except Exception:
-            pass
+    return _wav_header(frame_count, sample_rate) + bytes(2 * frame_count)
+
+
+def _flatten_numeric_samples(data: Any) -> Any:
+    # Array fast paths: flatten in C instead of walking `.tolist()` output.
+    if isinstance(data, _NDARRAY_CLS):
+        return data.reshape(-1)
+    if isinstance(data, _TENSOR_CLS):
+        flat = data.detach().cpu().reshape(-1).float()
+        return flat.numpy() if np is not None else flat.tolist()
 
     if isinstance(data, (list, tuple)):
         flattened: list[float] = []
@@ -81,32 +119,151 @@ def _flatten_numeric_samples(data: Any) -> list[float]:
             flattened.extend(_flatten_numeric_samples(item))
         return flattened
 
+    # Other sequence types such as array.array (used when NumPy is absent) still expose tolist().
+    tolist = getattr(data, "tolist", None)
+    if callable(tolist):
+        return _flatten_numeric_samples(tolist())
+
     return [float(data)]
 
 
-def _to_wav_bytes(samples: Sequence[float], sample_rate: int) -> bytes:
-    clipped = [max(-1.0, min(1.0, sample)) for sample in _flatten_numeric_samples(samples)]
-    pcm = b"".join(struct.pack("<h", int(sample * 32767.0)) for sample in clipped)
-    with io.BytesIO() as buffer:
-        with wave.open(buffer, "wb") as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)
-            wav.setframerate(sample_rate)
-            wav.writeframes(pcm)
-        return buffer.getvalue()
+@functools.lru_cache(maxsize=4)
+def _pcm16_scale_limit(dtype: Any) -> float:
+    # 32767 is not representable in float16/bfloat16 and rounds up to 32768, which wraps in int16;
+    # clamp to the largest value of `dtype` below 32768 instead.
+    limit = _torch.tensor(32768.0, dtype=dtype)
+    return float(_torch.nextafter(limit, _torch.zeros_like(limit)))
+
+
+def _pcm16_from_tensor(tensor: Any) -> Any:
+    flat = tensor.detach().cpu().reshape(-1)
+    if flat.dtype in (_torch.float16, _torch.bfloat16):
+        # Scale in the model's own precision: no full-buffer float32 up-cast.
+        limit = _pcm16_scale_limit(flat.dtype)
+        scaled = flat.nan_to_num(nan=1.0).mul_(32767.0).clamp_(-limit, limit)
+    elif flat.dtype == _torch.float32:
+        if _QUANTIZE_READY:
+            # CPU float32 tensors share memory with .numpy(), so the compiled kernel reads them in place.
+            # It is ready once the background warmup started by the first model load has finished.
+            return _quantize_with_numba(flat.numpy())
+        # Out-of-place clamp so the caller's tensor is never mutated.
+        scaled = flat.clamp(-1.0, 1.0).nan_to_num_(nan=1.0).mul_(32767.0)
+    else:
+        scaled = flat.float().clamp_(-1.0, 1.0).nan_to_num_(nan=1.0).mul_(32767.0)
+    return scaled.to(_torch.int16).numpy()
+
+
+def _quantize_i16_source(samples: Any, out: Any) -> None:
+    # Compiled with numba.njit by `_compile_quantize_kernel`; never called directly.
+    for index in range(samples.shape[0]):
+        value = samples[index]
+        # `not value <= 1.0` sends NaN to full scale, the same policy as every other PCM path.
+        if not value <= 1.0:
+            value = 1.0
+        elif value < -1.0:
+            value = -1.0
+        out[index] = int(value * 32767.0)
+
+
+# The kernel is compiled on a background thread (first model load, or eager warmup); until it is
+# ready the NumPy path is used, so no request ever pays the numba import or JIT cost.
+_quantize_i16: Optional[Any] = None
+_QUANTIZE_READY = False
+_QUANTIZE_COMPILE_ATTEMPTED = False
+_QUANTIZE_WARMUP_STARTED = False
+_QUANTIZE_LOCK = threading.Lock()
+
+
+def _compile_quantize_kernel() -> None:
+    global _quantize_i16
+    global _QUANTIZE_READY
+    global _QUANTIZE_COMPILE_ATTEMPTED
+    with _QUANTIZE_LOCK:
+        if np is None or _QUANTIZE_COMPILE_ATTEMPTED:
+            return
+        _QUANTIZE_COMPILE_ATTEMPTED = True
+        try:
+            from numba import njit  # type: ignore[import-not-found]
+
+            kernel = njit(_quantize_i16_source)
+            kernel(np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.int16))
+        except Exception as error:
+            _debug(f"numba quantize unavailable; using numpy: {type(error).__name__}: {error}")
+            return
+        _quantize_i16 = kernel
+        _QUANTIZE_READY = True
 
 
-def _normalize_samples(data: Any) -> Sequence[float]:
-    if hasattr(data, "detach") and callable(data.detach):
+def _start_quantize_kernel_warmup() -> None:
+    global _QUANTIZE_WARMUP_STARTED
+    if np is None or _QUANTIZE_WARMUP_STARTED or _QUANTIZE_COMPILE_ATTEMPTED:
+        return
+    _QUANTIZE_WARMUP_STARTED = True
+    threading.Thread(target=_compile_quantize_kernel, name="qwen-tts-quantize-warmup", daemon=True).start()
+
+
+def _quantize_with_numba(floats: Any) -> Optional[Any]:
+    if not _QUANTIZE_READY:
+        return None
+    out = np.empty(floats.shape[0], dtype=np.int16)
+    _quantize_i16(np.ascontiguousarray(floats, dtype=np.float32), out)
+    return out
+
+
+def _pcm16_from_floats(samples: Any) -> Any:
+    if np is None:
+        # Without NumPy, array.array still does the int16 packing in C.
+        clipped = (max(-1.0, min(1.0, sample)) for sample in _flatten_numeric_samples(samples))
+        pcm = array.array("h", (int(sample * 32767.0) for sample in clipped))
+        if sys.byteorder == "big":
+            pcm.byteswap()
+        return pcm
+
+    if isinstance(samples, GeneratorType):
+        floats = np.fromiter(samples, dtype=np.float32)
+    else:
         try:
-            data = data.detach().cpu().numpy().tolist()
-        except Exception:
-            pass
-    elif hasattr(data, "tolist") and callable(data.tolist):
+            floats = np.asarray(samples, dtype=np.float32).reshape(-1)
+        except (TypeError, ValueError):
+            # Ragged or exotic nesting; flatten in Python once, then vectorize.
+            floats = np.asarray(_flatten_numeric_samples(samples), dtype=np.float32)
+    pcm = _quantize_with_numba(floats)
+    if pcm is not None:
+        return pcm
+    floats = np.clip(floats, -1.0, 1.0)
+    np.nan_to_num(floats, copy=False, nan=1.0)
+    floats *= 32767.0
+    return floats.astype("<i2")
+
+
+def _to_wav_bytes_from_float_iterable(samples: Any, sample_rate: int) -> bytes:
+    # Tensor.numpy() needs NumPy; without it tensors go through tolist() into the array.array path.
+    if np is not None and isinstance(samples, _TENSOR_CLS):
+        pcm = _pcm16_from_tensor(samples)
+    else:
+        pcm = _pcm16_from_floats(samples)
+    # PCM producers hand back int16 buffers; joining them with the header copies the samples
+    # exactly once into the final bytes object, which the bridge then reads without copying.
+    return b"".join((_wav_header(memoryview(pcm).nbytes // 2, sample_rate), pcm))
+
+
+def _normalize_samples(data: Any) -> Any:
+    if isinstance(data, _TENSOR_CLS):
+        # Stay in torch so the WAV writer can quantize in-tensor (numpy lacks bfloat16).
+        return data.detach().cpu().reshape(-1)
+    if isinstance(data, (list, tuple)) and len(data) == 1 and isinstance(data[0], _TENSOR_CLS):
+        return data[0].detach().cpu().reshape(-1)
+
+    if isinstance(data, _NDARRAY_CLS):
+        return data.reshape(-1)
+    if np is not None:
         try:
-            data = data.tolist()
-        except Exception:
+            floats = np.asarray(data, dtype=np.float32)
+        except (TypeError, ValueError):
             pass
+        else:
+            # A (1, N) batch collapses to its single row; larger batches are concatenated.
+            return floats.reshape(-1)
 
     if isinstance(data, tuple):
         data = list(data)
@@ -125,7 +282,25 @@ def _normalize_samples(data: Any) -> Sequence[float]:
     return data
 
 
+def _payload_to_wav_bytes(payload: Any, sample_rate: int) -> Optional[bytes]:
+    if isinstance(payload, _BYTES_LIKE):
+        return bytes(payload)
+    if payload is None:
+        return None
+    return _to_wav_bytes_from_float_iterable(_normalize_samples(payload), sample_rate)
+
+
+def _output_to_wav_bytes(output: Any) -> Optional[bytes]:
+    # Already-encoded WAV skips the dict/tuple unwrapping entirely.
+    if isinstance(output, _BYTES_LIKE):
+        return bytes(output)
+    wav_payload, sr = _extract_audio_and_sample_rate(output, 24_000)
+    return _payload_to_wav_bytes(wav_payload, sr)
+
+
 def _extract_audio_and_sample_rate(output: Any, default_sample_rate: int) -> tuple[Any, int]:
+    if isinstance(output, _BYTES_LIKE):
+        return output, default_sample_rate
     if isinstance(output, dict):
         wav = output.get("wav")
         sample_rate = int(output.get("sampling_rate", output.get("sample_rate", default_sample_rate)))
@@ -139,17 +314,26 @@ def _extract_audio_and_sample_rate(output: Any, default_sample_rate: int) -> tup
     return output, default_sample_rate
 
 
+_LOCAL_MODEL_PATH_OVERRIDE = os.getenv("TTM_QWEN_LOCAL_MODEL_PATH")
+_PYTHON_HOME = os.getenv("PYTHONHOME")
+# Only hits are cached: staged model directories can appear while the process runs.
+_LOCAL_MODEL_PATHS: dict[str, str] = {}
+
+
 def _resolve_local_model_path(model_id: str) -> Optional[str]:
-    explicit = os.getenv("TTM_QWEN_LOCAL_MODEL_PATH")
-    if explicit:
-        return explicit
+    if _LOCAL_MODEL_PATH_OVERRIDE:
+        return _LOCAL_MODEL_PATH_OVERRIDE
+
+    cached = _LOCAL_MODEL_PATHS.get(model_id)
+    if cached is not None:
+        return cached
 
-    python_home = os.getenv("PYTHONHOME")
-    if not python_home:
+    if not _PYTHON_HOME:
         return None
 
-    local_candidate = os.path.join(python_home, "models", os.path.basename(model_id))
+    local_candidate = os.path.join(_PYTHON_HOME, "models", os.path.basename(model_id))
     if os.path.isdir(local_candidate):
+        _LOCAL_MODEL_PATHS[model_id] = local_candidate
         return local_candidate
     return None
 
@@ -163,20 +347,38 @@ def _debug(message: str) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def _torch_debug_summary() -> str:
+    if _torch is None:
+        return f"torch unavailable ({_TORCH_IMPORT_ERROR})"
     try:
-        import torch  # type: ignore[import-not-found]
-    except Exception as error:
-        return f"torch unavailable ({error})"
-    try:
-        mps_available = bool(getattr(torch.backends, "mps", None) and torch.backends.mps.is_available())
+        mps_available = bool(getattr(_torch.backends, "mps", None) and _torch.backends.mps.is_available())
     except Exception:
         mps_available = False
     try:
-        mps_built = bool(getattr(torch.backends, "mps", None) and torch.backends.mps.is_built())
+        mps_built = bool(getattr(_torch.backends, "mps", None) and _torch.backends.mps.is_built())
     except Exception:
         mps_built = False
-    return f"torch={getattr(torch, '__version__', 'unknown')} mps_built={mps_built} mps_available={mps_available}"
+    return f"torch={getattr(_torch, '__version__', 'unknown')} mps_built={mps_built} mps_available={mps_available}"
+
+
+@functools.lru_cache(maxsize=1)
+def _mps_alloc_summary() -> str:
+    if _torch is None:
+        return f"torch_diag_error={type(_TORCH_IMPORT_ERROR).__name__}:{_TORCH_IMPORT_ERROR}"
+
+    try:
+        mps_available = bool(getattr(_torch.backends, "mps", None) and _torch.backends.mps.is_available())
+    except Exception:
+        mps_available = False
+
+    if not mps_available:
+        return "mps_alloc_skipped=unavailable"
+    try:
+        tensor = _torch.empty(1, device="mps")
+        return f"mps_alloc_ok={tensor.device}"
+    except Exception as error:
+        return f"mps_alloc_error={type(error).__name__}:{error}"
 
 
 def get_runtime_diagnostics() -> str:
@@ -186,49 +388,43 @@ def get_runtime_diagnostics() -> str:
         f"platform={platform.platform()}",
         f"machine={platform.machine()}",
         f"pythonhome={os.getenv('PYTHONHOME', '')}",
-        f"device_map={os.getenv('TTM_QWEN_DEVICE_MAP', 'auto')}",
-        f"dtype={os.getenv('TTM_QWEN_TORCH_DTYPE', 'float32')}",
+        f"device_map={_device_map()}",
+        f"dtype={_torch_dtype_name() or 'float32'}",
         _torch_debug_summary(),
+        _mps_alloc_summary(),
     ]
+    return " | ".join(details)
 
-    try:
-        import torch  # type: ignore[import-not-found]
 
-        try:
-            mps_available = bool(getattr(torch.backends, "mps", None) and torch.backends.mps.is_available())
-        except Exception:
-            mps_available = False
+def _device_map() -> str:
+    if _DEVICE_MAP_OVERRIDE is not None:
+        return _DEVICE_MAP_OVERRIDE
+    return os.getenv("TTM_QWEN_DEVICE_MAP", "auto")
 
-        if mps_available:
-            try:
-                tensor = torch.empty(1, device="mps")
-                details.append(f"mps_alloc_ok={tensor.device}")
-            except Exception as error:
-                details.append(f"mps_alloc_error={type(error).__name__}:{error}")
-        else:
-            details.append("mps_alloc_skipped=unavailable")
-    except Exception as error:
-        details.append(f"torch_diag_error={type(error).__name__}:{error}")
 
-    return " | ".join(details)
+def _torch_dtype_name() -> str:
+    if _TORCH_DTYPE_OVERRIDE is not None:
+        return _TORCH_DTYPE_OVERRIDE
+    return (os.getenv("TTM_QWEN_TORCH_DTYPE") or "").strip().lower()
 
 
 def _target_dtype() -> Any:
-    raw = os.getenv("TTM_QWEN_TORCH_DTYPE")
-    if raw is None or not raw.strip():
+    requested = _torch_dtype_name()
+    if not requested:
         return None
+    return _dtype_for_name(requested)
 
-    try:
-        import torch  # type: ignore[import-not-found]
-    except Exception:
-        return None
 
-    requested = raw.strip().lower()
+@functools.lru_cache(maxsize=4)
+def _dtype_for_name(requested: str) -> Any:
+    # Keyed by name rather than a single global so the CPU/float32 retry can still switch dtype.
+    if _torch is None:
+        return None
     if requested == "float16":
-        return torch.float16
+        return _torch.float16
     if requested == "bfloat16":
-        return torch.bfloat16
-    return torch.float32
+        return _torch.bfloat16
+    return _torch.float32
 
 
 def _load_qwen_module() -> Optional[Any]:
@@ -256,7 +452,7 @@ def _create_model(model_id: str) -> Optional[Any]:
 
     source = _resolve_local_model_path(model_id) or model_id
     kwargs = {
-        "device_map": os.getenv("TTM_QWEN_DEVICE_MAP", "auto"),
+        "device_map": _device_map(),
     }
 
     dtype = _target_dtype()
@@ -309,14 +505,7 @@ def _candidates_for_mode(mode: str, requested_model: str, strict: bool = False)
                     continue
                 ordered.append((fallback_mode, model_id))
 
-    seen: set[tuple[str, str]] = set()
-    unique: list[tuple[str, str]] = []
-    for entry in ordered:
-        if entry in seen:
-            continue
-        seen.add(entry)
-        unique.append(entry)
-    return unique
+    return list(dict.fromkeys(ordered))
 
 
 def load_model(mode: Optional[str] = None, model_id: Optional[str] = None, strict: Optional[str] = None) -> bool:
@@ -324,13 +513,15 @@ def load_model(mode: Optional[str] = None, model_id: Optional[str] = None, stric
     global _QWEN_MODEL
     global _ACTIVE_MODE
     global _ACTIVE_MODEL_ID
+    global _ACTIVE_KEY
 
     strict_load = strict == "1" if strict is not None else False
+    _start_quantize_kernel_warmup()
 
     resolved_mode = _resolve_mode(mode)
     resolved_model = _resolve_model(resolved_mode, model_id)
 
-    if _MODEL_LOADED and _QWEN_MODEL is not None and _ACTIVE_MODE == resolved_mode and _ACTIVE_MODEL_ID == resolved_model:
+    if _ACTIVE_KEY == (resolved_mode, resolved_model):
         _debug("model already loaded")
         return True
 
@@ -346,6 +537,7 @@ def load_model(mode: Optional[str] = None, model_id: Optional[str] = None, stric
         _MODEL_LOADED = True
         _ACTIVE_MODE = candidate_mode
         _ACTIVE_MODEL_ID = candidate_model
+        _ACTIVE_KEY = (candidate_mode, candidate_model)
         _debug(f"model loaded mode={candidate_mode!r} model={candidate_model!r} in {elapsed:.2f}s")
         return True
 
@@ -353,6 +545,7 @@ def load_model(mode: Optional[str] = None, model_id: Optional[str] = None, stric
     _MODEL_LOADED = False
     _ACTIVE_MODE = None
     _ACTIVE_MODEL_ID = None
+    _ACTIVE_KEY = None
     return _ALLOW_FALLBACK
 
 
@@ -361,11 +554,13 @@ def unload_model() -> bool:
     global _QWEN_MODEL
     global _ACTIVE_MODE
     global _ACTIVE_MODEL_ID
+    global _ACTIVE_KEY
 
     _QWEN_MODEL = None
     _MODEL_LOADED = False
     _ACTIVE_MODE = None
     _ACTIVE_MODEL_ID = None
+    _ACTIVE_KEY = None
     return True
 
 
@@ -374,9 +569,7 @@ def is_model_loaded() -> bool:
 
 
 def _ensure_loaded(mode: str, model_id: str) -> bool:
-    if _MODEL_LOADED and _QWEN_MODEL is not None and _ACTIVE_MODE == mode and _ACTIVE_MODEL_ID == model_id:
-        return True
-    return load_model(mode=mode, model_id=model_id, strict="0")
+    return _ACTIVE_KEY == (mode, model_id) or load_model(mode=mode, model_id=model_id, strict="0")
 
 
 def _is_sampling_numerics_error(error: BaseException) -> bool:
@@ -395,10 +588,13 @@ def _retry_on_cpu_after_sampling_numerics_error(
     model_id: str,
     generate_fn: Any,
 ) -> Optional[bytes]:
+    global _DEVICE_MAP_OVERRIDE
+    global _TORCH_DTYPE_OVERRIDE
+
     if not _is_sampling_numerics_error(error):
         return None
 
-    current_device_map = os.getenv("TTM_QWEN_DEVICE_MAP", "auto").strip().lower()
+    current_device_map = _device_map().strip().lower()
     if current_device_map == "cpu":
         return None
 
@@ -407,12 +603,9 @@ def _retry_on_cpu_after_sampling_numerics_error(
         f"(mode={mode}, model={model_id}, previous_device_map={current_device_map})"
     )
 
-    previous_device_map = os.getenv("TTM_QWEN_DEVICE_MAP")
-    previous_dtype = os.getenv("TTM_QWEN_TORCH_DTYPE")
-
     try:
-        os.environ["TTM_QWEN_DEVICE_MAP"] = "cpu"
-        os.environ["TTM_QWEN_TORCH_DTYPE"] = "float32"
+        _DEVICE_MAP_OVERRIDE = "cpu"
+        _TORCH_DTYPE_OVERRIDE = "float32"
         unload_model()
         if not load_model(mode=mode, model_id=model_id, strict="1"):
             _debug("cpu retry load failed")
@@ -427,15 +620,8 @@ def _retry_on_cpu_after_sampling_numerics_error(
         _debug("cpu retry synthesis succeeded")
         return audio
     finally:
-        if previous_device_map is None:
-            os.environ.pop("TTM_QWEN_DEVICE_MAP", None)
-        else:
-            os.environ["TTM_QWEN_DEVICE_MAP"] = previous_device_map
-
-        if previous_dtype is None:
-            os.environ.pop("TTM_QWEN_TORCH_DTYPE", None)
-        else:
-            os.environ["TTM_QWEN_TORCH_DTYPE"] = previous_dtype
+        _DEVICE_MAP_OVERRIDE = None
+        _TORCH_DTYPE_OVERRIDE = None
 
 
 def _generate_voice_design(text: str, instruct: str, language: str) -> Optional[bytes]:
@@ -447,12 +633,7 @@ def _generate_voice_design(text: str, instruct: str, language: str) -> Optional[
         language=language,
         instruct=instruct,
     )
-    wav_payload, sr = _extract_audio_and_sample_rate(output, 24_000)
-    if isinstance(wav_payload, (bytes, bytearray, memoryview)):
-        return bytes(wav_payload)
-    if wav_payload is not None:
-        return _to_wav_bytes(_normalize_samples(wav_payload), sr)
-    return None
+    return _output_to_wav_bytes(output)
 
 
 def _generate_custom_voice(text: str, speaker: str, instruct: Optional[str], language: str) -> Optional[bytes]:
@@ -480,18 +661,88 @@ def _generate_custom_voice(text: str, speaker: str, instruct: Optional[str], lan
         # Runtime compatibility fallback for older qwen_tts builds.
         kwargs.pop("instruct", None)
         output = _QWEN_MODEL.generate_custom_voice(**kwargs)
-    wav_payload, sr = _extract_audio_and_sample_rate(output, 24_000)
-    if isinstance(wav_payload, (bytes, bytearray, memoryview)):
-        return bytes(wav_payload)
-    if wav_payload is not None:
-        return _to_wav_bytes(_normalize_samples(wav_payload), sr)
+    return _output_to_wav_bytes(output)
+
+
+def _decode_reference_audio(reference_audio: bytes) -> Optional[tuple[Any, int]]:
+    try:
+        import soundfile  # type: ignore[import-not-found]
+
+        waveform, sample_rate = soundfile.read(io.BytesIO(reference_audio), dtype="float32")
+    except Exception as error:
+        _debug(f"reference audio decode skipped: {type(error).__name__}: {error}")
+        return None
+    return waveform, int(sample_rate)
+
+
+def _is_reference_format_error(error: BaseException) -> bool:
+    if _is_sampling_numerics_error(error):
+        return False
+    if isinstance(error, (TypeError, ValueError, OSError, AttributeError)):
+        return True
+    soundfile_error = getattr(sys.modules.get("soundfile"), "SoundFileError", None)
+    if soundfile_error is not None and isinstance(error, soundfile_error):
+        return True
+    # torch raises a bare RuntimeError when it cannot turn an unsupported reference object into a tensor.
+    return "could not infer dtype" in str(error).lower()
+
+
+def _try_voice_clone_candidates(candidates: Iterable[dict[str, Any]], speculative: bool = False) -> Optional[bytes]:
+    for candidate in candidates:
+        method_name = candidate["method"]
+        method = getattr(_QWEN_MODEL, method_name, None)
+        if not callable(method):
+            continue
+        try:
+            output = method(**candidate["kwargs"])
+        except TypeError:
+            continue
+        except Exception as error:
+            # In-memory references are a guess at the build's API: only reference-format failures fall
+            # through to the temp file; real generation failures surface immediately.
+            if not speculative or not _is_reference_format_error(error):
+                raise
+            _debug(f"in-memory voice clone attempt failed method={method_name!r}: {type(error).__name__}: {error}")
+            continue
+        audio = _output_to_wav_bytes(output)
+        if audio is not None:
+            return audio
     return None
 
 
+def _in_memory_voice_clone_candidates(text: str, reference_audio: bytes, language: str) -> Iterator[dict[str, Any]]:
+    yield {
+        "method": "generate_voice_clone",
+        "kwargs": {
+            "text": text,
+            "language": language,
+            "reference_audio": io.BytesIO(reference_audio),
+        },
+    }
+    # Decoded lazily so a successful BytesIO attempt never pays for it.
+    decoded_reference = _decode_reference_audio(reference_audio)
+    if decoded_reference is not None:
+        yield {
+            "method": "generate_voice_clone",
+            "kwargs": {
+                "text": text,
+                "language": language,
+                "prompt_audio": decoded_reference,
+            },
+        }
+
+
 def _generate_voice_clone(text: str, reference_audio: bytes, language: str) -> Optional[bytes]:
     if _QWEN_MODEL is None:
         return None
 
+    audio = _try_voice_clone_candidates(
+        _in_memory_voice_clone_candidates(text, reference_audio, language),
+        speculative=True,
+    )
+    if audio is not None:
+        return audio
+
     reference_path: Optional[str] = None
     try:
         import tempfile
@@ -526,21 +777,7 @@ def _generate_voice_clone(text: str, reference_audio: bytes, language: str) -> O
                 },
             },
         ]
-
-        for candidate in candidates:
-            method_name = candidate["method"]
-            method = getattr(_QWEN_MODEL, method_name, None)
-            if not callable(method):
-                continue
-            try:
-                output = method(**candidate["kwargs"])
-                wav_payload, sr = _extract_audio_and_sample_rate(output, 24_000)
-                if isinstance(wav_payload, (bytes, bytearray, memoryview)):
-                    return bytes(wav_payload)
-                if wav_payload is not None:
-                    return _to_wav_bytes(_normalize_samples(wav_payload), sr)
-            except TypeError:
-                continue
+        return _try_voice_clone_candidates(candidates)
     finally:
         if reference_path and os.path.exists(reference_path):
             try:
@@ -548,8 +785,6 @@ def _generate_voice_clone(text: str, reference_audio: bytes, language: str) -> O
             except Exception:
                 pass
 
-    return None
-
 
 def get_supported_speakers(mode: Optional[str] = None, model_id: Optional[str] = None) -> list[str]:
     resolved_mode = _resolve_mode(mode)
@@ -574,25 +809,35 @@ def get_supported_speakers_csv(mode: Optional[str] = None, model_id: Optional[st
     return ",".join(get_supported_speakers(mode=mode, model_id=model_id))
 
 
-def synthesize_voice_design(text: str, instruct: str, language: str, sample_rate: int, model_id: str) -> bytes:
-    if not text.strip():
+_SYNTH_DISPATCH: dict[str, tuple[Any, tuple[str, ...], str]] = {
+    "voice_design": (_generate_voice_design, ("text", "instruct", "language"), "VoiceDesign"),
+    "custom_voice": (_generate_custom_voice, ("text", "speaker", "instruct", "language"), "CustomVoice"),
+    "voice_clone": (_generate_voice_clone, ("text", "reference_audio", "language"), "VoiceClone"),
+}
+
+
+def _synthesize(mode: str, kwargs: dict[str, Any], sample_rate: int, model_id: str) -> bytes:
+    generate_fn, argument_names, label = _SYNTH_DISPATCH[mode]
+    if not kwargs["text"].strip():
         raise ValueError("text must not be empty")
+    if "reference_audio" in argument_names and not kwargs["reference_audio"]:
+        raise ValueError("reference_audio must not be empty")
 
-    resolved_mode = "voice_design"
-    resolved_model = _resolve_model(resolved_mode, model_id)
-    resolved_language = language or DEFAULT_LANGUAGE
+    resolved_model = _resolve_model(mode, model_id)
+    generate_kwargs = {name: kwargs[name] for name in argument_names}
+    generate_kwargs["language"] = generate_kwargs["language"] or DEFAULT_LANGUAGE
 
-    if not _ensure_loaded(mode=resolved_mode, model_id=resolved_model):
+    if not _ensure_loaded(mode=mode, model_id=resolved_model):
         raise RuntimeError("Qwen3-TTS runtime unavailable: failed to load model")
 
     try:
-        audio = _generate_voice_design(text=text, instruct=instruct or "", language=resolved_language)
+        audio = generate_fn(**generate_kwargs)
     except RuntimeError as error:
         audio = _retry_on_cpu_after_sampling_numerics_error(
             error=error,
-            mode=resolved_mode,
+            mode=mode,
             model_id=resolved_model,
-            generate_fn=lambda: _generate_voice_design(text=text, instruct=instruct or "", language=resolved_language),
+            generate_fn=lambda: generate_fn(**generate_kwargs),
         )
         if audio is None:
             raise
@@ -602,86 +847,47 @@ def synthesize_voice_design(text: str, instruct: str, language: str, sample_rate
     if _ALLOW_FALLBACK:
         return _silent_wav(sample_rate=sample_rate)
 
-    raise RuntimeError("Qwen3-TTS VoiceDesign synthesis failed")
+    raise RuntimeError(f"Qwen3-TTS {label} synthesis failed")
 
 
-def synthesize_custom_voice(text: str, speaker: str, instruct: str, language: str, sample_rate: int, model_id: str) -> bytes:
-    if not text.strip():
-        raise ValueError("text must not be empty")
-
-    resolved_mode = "custom_voice"
-    resolved_model = _resolve_model(resolved_mode, model_id)
-    resolved_language = language or DEFAULT_LANGUAGE
-
-    if not _ensure_loaded(mode=resolved_mode, model_id=resolved_model):
-        raise RuntimeError("Qwen3-TTS runtime unavailable: failed to load model")
-
-    try:
-        audio = _generate_custom_voice(
-            text=text,
-            speaker=speaker or DEFAULT_SPEAKER,
-            instruct=instruct,
-            language=resolved_language,
-        )
-    except RuntimeError as error:
-        audio = _retry_on_cpu_after_sampling_numerics_error(
-            error=error,
-            mode=resolved_mode,
-            model_id=resolved_model,
-            generate_fn=lambda: _generate_custom_voice(
-                text=text,
-                speaker=speaker or DEFAULT_SPEAKER,
-                instruct=instruct,
-                language=resolved_language,
-            ),
-        )
-        if audio is None:
-            raise
-    if audio is not None:
-        return audio
+def synthesize_voice_design(text: str, instruct: str, language: str, sample_rate: int, model_id: str) -> bytes:
+    return _synthesize(
+        "voice_design",
+        {"text": text, "instruct": instruct or "", "language": language},
+        sample_rate,
+        model_id,
+    )
 
-    if _ALLOW_FALLBACK:
-        return _silent_wav(sample_rate=sample_rate)
 
-    raise RuntimeError("Qwen3-TTS CustomVoice synthesis failed")
+def synthesize_custom_voice(text: str, speaker: str, instruct: str, language: str, sample_rate: int, model_id: str) -> bytes:
+    return _synthesize(
+        "custom_voice",
+        {"text": text, "speaker": speaker or DEFAULT_SPEAKER, "instruct": instruct, "language": language},
+        sample_rate,
+        model_id,
+    )
 
 
 def synthesize_voice_clone(text: str, reference_audio: bytes, language: str, sample_rate: int, model_id: str) -> bytes:
-    if not text.strip():
-        raise ValueError("text must not be empty")
-    if not reference_audio:
-        raise ValueError("reference_audio must not be empty")
-
-    resolved_mode = "voice_clone"
-    resolved_model = _resolve_model(resolved_mode, model_id)
-    resolved_language = language or DEFAULT_LANGUAGE
+    return _synthesize(
+        "voice_clone",
+        {"text": text, "reference_audio": reference_audio, "language": language},
+        sample_rate,
+        model_id,
+    )
 
-    if not _ensure_loaded(mode=resolved_mode, model_id=resolved_model):
-        raise RuntimeError("Qwen3-TTS runtime unavailable: failed to load model")
 
-    try:
-        audio = _generate_voice_clone(
-            text=text,
-            reference_audio=reference_audio,
-            language=resolved_language,
-        )
-    except RuntimeError as error:
-        audio = _retry_on_cpu_after_sampling_numerics_error(
-            error=error,
-            mode=resolved_mode,
-            model_id=resolved_model,
-            generate_fn=lambda: _generate_voice_clone(
-                text=text,
-                reference_audio=reference_audio,
-                language=resolved_language,
-            ),
-        )
-        if audio is None:
-            raise
-    if audio is not None:
-        return audio
+def _warm_runtime() -> None:
+    started_at = time.monotonic()
+    _compile_quantize_kernel()
+    module = _load_qwen_module()
+    elapsed = time.monotonic() - started_at
+    _debug(
+        f"eager warmup quantize_kernel={_QUANTIZE_READY} "
+        f"qwen_tts_import={'succeeded' if module is not None else 'failed'} in {elapsed:.2f}s"
+    )
 
-    if _ALLOW_FALLBACK:
-        return _silent_wav(sample_rate=sample_rate)
 
-    raise RuntimeError("Qwen3-TTS VoiceClone synthesis failed")
+if _EAGER_LOAD:
+    # Overlap the heavy qwen_tts/transformers import with host startup instead of the first synthesize call.
+    threading.Thread(target=_warm_runtime, name="qwen-tts-warmup", daemon=True).start()